@@ -1,55 +1,90 @@
-from minesweeper.tile import Tile
+from minesweeper.tile import Tile, MARK_FLAG
+from collections import deque
+from time import monotonic
 import random
 from string import ascii_letters as letters
 
+_COL_LABELS = tuple(sorted(letters))
 
-def _prev(lst, idx):
-    return lst[lst.index(idx) - 1]
+_NBR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
 
 
-def _next(lst, idx):
-    return lst[lst.index(idx) + 1]
+def _neighbour_indices(ri, ci, rows, columns):
+    """Return flat row-major indices of the neighbours of tile (ri, ci)."""
+    return [(ri + dr) * columns + ci + dc
+            for dr, dc in _NBR_OFFSETS
+            if 0 <= ri + dr < rows and 0 <= ci + dc < columns]
 
 
 class MineSweeper:
     """Minesweeper."""
     
-    def __init__(self):
-        self.tiles = {}
+    def __init__(self, seed=None):
+        self._rng = random.Random(seed)
+        self.tiles = []
         self.num_bombs = 0
-        self.time = 0
+        self.start_time = None
+        self._stopped_time = 0
         self.unmarked_bombs = 0
-        self.rows = {}
-        self.columns = {}
-        self.sorted_letters = sorted(letters)
+        self.unclicked_safe = 0
+        self.clicked_bombs = 0
+        self.n_rows = 0
+        self.n_cols = 0
     
-    def tick(self):
-        if self.time < 999:
-            self.time += 1
+    @property
+    def time(self):
+        """Seconds since the timer started, capped at 999."""
+        if self.start_time is None:
+            return self._stopped_time
+        return min(999, int(monotonic() - self.start_time))
+    
+    def start_timer(self):
+        self.start_time = monotonic()
+    
+    def stop_timer(self):
+        """Freeze the elapsed time at its current value."""
+        if self.start_time is not None:
+            self._stopped_time = min(999, int(monotonic() - self.start_time))
+            self.start_time = None
     
     def setup(self, rows, columns, bombs=0, scatter_now=False):
-        self.rows = {x: str(x + 1) for x in range(rows)}  # {0: '1', 1: '2', 2: '3'}
-        self.columns = {x: self.sorted_letters[x] for x in range(columns)}  # {0: 'a', 1: 'b', 2: 'c'}
+        self.n_rows = rows
+        self.n_cols = columns
         self.num_bombs = bombs
         if self.num_bombs > (rows * columns) - 1:
             self.num_bombs = (rows * columns) - 1
         self.unmarked_bombs = bombs
+        self.unclicked_safe = rows * columns - self.num_bombs
+        self.clicked_bombs = 0
         self.tiles.clear()
-        self.time = 0
-        # Create tiles
-        for row in self.rows.values():  # ['a', 'b', 'c', 'd', 'e']
-            for column in self.columns.values():  # ['1', '2', '3', '4', '5']
-                neighbours = self.get_neighbours(row, column)
-                tile = Tile(row=row, column=column, neighbours=neighbours)
-                self.tiles[column + row] = tile
+        self.start_time = None
+        self._stopped_time = 0
+        # Create tiles in a flat row-major list, so lookups are plain
+        # integer indexing instead of string-keyed dict hashes.
+        row_labels = [str(i + 1) for i in range(rows)]  # ['1', '2', '3', '4', '5']
+        col_labels = _COL_LABELS[:columns]  # ('A', 'B', 'C', 'D', 'E')
+        for ri in range(rows):
+            for ci in range(columns):
+                tile = Tile(row=row_labels[ri], column=col_labels[ci])
+                self.tiles.append(tile)
+        # Resolve neighbour references once, so adjacency queries don't
+        # pay an index lookup per neighbour. Only the tuple of tile
+        # references is kept; the index lists are throwaway.
+        tiles = self.tiles
+        for i, tile in enumerate(tiles):
+            ri, ci = divmod(i, columns)
+            tile.adj = tuple(tiles[j] for j in _neighbour_indices(ri, ci, rows, columns))
         # If specified, scatter bombs right away
         if scatter_now:
             self.scatter_bombs()
     
     def reset(self, scatter_now=False):
-        self.time = 0
+        self.start_time = None
+        self._stopped_time = 0
         self.unmarked_bombs = self.num_bombs
-        for tile in self.tiles.values():
+        self.unclicked_safe = len(self.tiles) - self.num_bombs
+        self.clicked_bombs = 0
+        for tile in self.tiles:
             tile.is_clicked = False
             tile.number = 0
             tile.is_safe = True
@@ -58,99 +93,110 @@ class MineSweeper:
             self.scatter_bombs()
     
     def scatter_bombs(self, tile_to_avoid=None):
-        """Choose a number of random safe tiles and make them bombs."""
-        for x in range(self.num_bombs):
-            # Choose a random safe tile
-            rand_tile = random.choice(list(self.tiles.values()))
-            while not rand_tile.is_safe or rand_tile == tile_to_avoid:
-                rand_tile = random.choice(list(self.tiles.values()))
-            
-            rand_tile.is_safe = False
-        
-        self.set_tile_nums()
-    
-    def get_neighbours(self, r, c):
-        
-        rows = sorted(list(self.rows.values()), key=int)
-        cols = sorted(list(self.columns.values()))
-        
-        neighbours = {}
-        
-        if r != rows[0] and c != cols[0]:
-            neighbours['top-left'] = _prev(cols, c) + _prev(rows, r)
-        if r != rows[0]:
-            neighbours['top'] = c + _prev(rows, r)
-        if r != rows[0] and c != cols[-1]:
-            neighbours['top-right'] = _next(cols, c) + _prev(rows, r)
-        if r != rows[-1] and c != cols[0]:
-            neighbours['bottom-left'] = _prev(cols, c) + _next(rows, r)
-        if r != rows[-1]:
-            neighbours['bottom'] = c + _next(rows, r)
-        if r != rows[-1] and c != cols[-1]:
-            neighbours['bottom-right'] = _next(cols, c) + _next(rows, r)
-        if c != cols[0]:
-            neighbours['left'] = _prev(cols, c) + r
-        if c != cols[-1]:
-            neighbours['right'] = _next(cols, c) + r
-        return neighbours
+        """
+        Choose a number of random safe tiles and make them bombs.
+
+        If tile_to_avoid is given, its whole 3x3 opening zone is kept
+        clear so a first click always opens an area, falling back to
+        protecting just the tile itself when the board is too dense.
+        """
+        avoid = set()
+        if tile_to_avoid is not None:
+            avoid.add(tile_to_avoid)
+            avoid.update(tile_to_avoid.adj)
+        candidates = [t for t in self.tiles if t not in avoid]
+        if len(candidates) < self.num_bombs:
+            candidates = [t for t in self.tiles if t is not tile_to_avoid]
+        bombs = self._rng.sample(candidates, self.num_bombs)
+        for tile in bombs:
+            tile.is_safe = False
+
+        self.set_tile_nums(bombs)
     
+    def tile_at(self, row, column):
+        """Return the tile at (row, column), both zero-based indices."""
+        return self.tiles[row * self.n_cols + column]
+
     def get_adjacent_tiles(self, tile):
-        return [self.tiles[c] for c in tile.neighbours.values()]
+        return tile.adj
     
-    def set_tile_nums(self):
-        for tile in self.tiles.values():
-            for adjacent_tile in self.get_adjacent_tiles(tile):
-                if not adjacent_tile.is_safe:
-                    tile.number += 1
+    def set_tile_nums(self, bombs=None):
+        """Set each tile's number by spreading +1 out from each bomb."""
+        if bombs is None:
+            bombs = [tile for tile in self.tiles if not tile.is_safe]
+        for bomb in bombs:
+            for adjacent_tile in self.get_adjacent_tiles(bomb):
+                if adjacent_tile.is_safe:
+                    adjacent_tile.number += 1
     
     def click_tile(self, tile):
-        if not tile.is_clicked:
-            if tile.mark != 'flag':
-                tile.is_clicked = True
-                if tile.number == 0 and tile.is_safe:
-                    adjacent_tiles = self.get_adjacent_tiles(tile)
-                    for adjacent_tile in [t for t in adjacent_tiles if not t.is_clicked]:
-                        self.click_tile(adjacent_tile)
-                    return True
-        return False
+        """Click a tile, flood-filling empty regions.
+
+        Returns the list of tiles that became clicked, so callers can
+        update just those instead of rescanning the whole board.
+        """
+        changed = []
+        if tile.is_clicked or tile.mark_idx == MARK_FLAG:
+            return changed
+        # Iterative BFS flood fill; recursing into each neighbour could
+        # blow the recursion limit on large empty regions. Bound methods
+        # and counters live in locals for the duration of the walk.
+        queue = deque((tile,))
+        popleft = queue.popleft
+        extend = queue.extend
+        append = changed.append
+        unclicked_safe = self.unclicked_safe
+        clicked_bombs = self.clicked_bombs
+        while queue:
+            t = popleft()
+            if t.is_clicked or t.mark_idx == MARK_FLAG:
+                continue
+            t.is_clicked = True
+            append(t)
+            if t.is_safe:
+                unclicked_safe -= 1
+                if t.number == 0:
+                    extend(a for a in t.adj if not a.is_clicked)
+            else:
+                clicked_bombs += 1
+        self.unclicked_safe = unclicked_safe
+        self.clicked_bombs = clicked_bombs
+        return changed
     
     def mark_tile(self, tile):
-        if not tile.is_clicked:
-            if tile.mark == 'flag':
-                self.unmarked_bombs += 1
-            tile.change_mark()
-            if tile.mark == 'flag':
-                self.unmarked_bombs -= 1
+        if tile.is_clicked:
+            return
+        was_flag = tile.mark_idx == MARK_FLAG
+        tile.change_mark()
+        self.unmarked_bombs += was_flag - (tile.mark_idx == MARK_FLAG)
     
     def click_all_bombs(self):
-        for tile in self.tiles.values():
+        """Click every bomb tile, returning the tiles that changed."""
+        changed = []
+        for tile in self.tiles:
             if not tile.is_safe:
-                self.click_tile(tile)
+                changed.extend(self.click_tile(tile))
+        return changed
     
     def game_is_won(self):
-        for tile in self.tiles.values():
-            if tile.is_safe and not tile.is_clicked:
-                return False
-        return True
+        return self.unclicked_safe == 0
     
     def game_is_lost(self):
-        for tile in self.tiles.values():
-            if not tile.is_safe and tile.is_clicked:
-                return True
-        return False
+        return self.clicked_bombs > 0
     
     def game_is_over(self):
         return self.game_is_won() or self.game_is_lost()
     
     def print_board_to_console(self):
-        for index, tile in enumerate(self.tiles):
+        cells = []
+        for tile in self.tiles:
             if tile.is_clicked:
-                print('c', end=' ')
+                cells.append('c')
             elif tile.is_safe:
-                print(tile.number, end=' ')
+                cells.append(str(tile.number))
             else:
-                print('b', end=' ')
-            # else:
-            #     print('?', end='')
-            if (index + 1) % len(self.columns) == 0:
-                print()
+                cells.append('b')
+        columns = self.n_cols
+        # Build the whole board string first so it goes out in a single
+        # print instead of one write per cell.
+        print('\n'.join(' '.join(cells[i:i + columns]) for i in range(0, len(cells), columns)))
@@ -22,19 +22,85 @@ Examples:
 """
 
 from minesweeper.core import MineSweeper
+from minesweeper.tile import MARKS, MARK_FLAG, MARK_QUESTION
 from pygame.mixer import Channel, Sound
 from webbrowser import open as webbopen
 from PIL import ImageTk, Image as Img
 from minesweeper import dialogs
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from pathlib import Path
 from tkinter import *
+from io import StringIO
 import pygame
 import json
+import csv
+import os
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib parser works fine
+    orjson = None
 
 DEFAULT_LEVEL = 'expert'
 BEST_TIMES_FILE = 'minesweeper/best_times.csv'
 SETTINGS_FILE = 'minesweeper/settings.json'
 HELP_LINK = 'https://www.instructables.com/How-to-play-minesweeper'
 
+# Parsed settings/best-times keyed by (filename, mtime_ns), so repeat
+# constructions skip the read and the decode while staying correct if
+# the file changes on disk.
+_PARSE_CACHE = {}
+
+# Every image key shipped per palette (as nm_<key>.png / bw_<key>.png).
+_IMAGE_KEYS = (
+    'tile_up', 'tile_down', 'tile_flag', 'tile_question', 'tile_question_down',
+    'tile_none', 'tile_bomb', 'tile_red', 'tile_x',
+    'tile_0', 'tile_1', 'tile_2', 'tile_3', 'tile_4',
+    'tile_5', 'tile_6', 'tile_7', 'tile_8',
+    'face_up', 'face_down', 'face_danger', 'face_win', 'face_loss',
+    'clock_ ', 'clock_-', 'clock_0', 'clock_1', 'clock_2', 'clock_3',
+    'clock_4', 'clock_5', 'clock_6', 'clock_7', 'clock_8', 'clock_9',
+)
+
+# Resolve every image path once at import time. Anchoring on __file__
+# also makes loading independent of the current working directory.
+_IMG_DIR = Path(__file__).resolve().parent / 'images'
+_IMAGE_PATHS = {
+    prefix: {key: _IMG_DIR / f'{prefix}_{key}.png' for key in _IMAGE_KEYS}
+    for prefix in ('nm', 'bw')
+}
+
+
+def _write_atomic(filename, payload):
+    """Write payload bytes to filename via a temp file and atomic rename."""
+    tmp = filename + '.tmp'
+    with open(tmp, 'wb') as file_out:
+        file_out.write(payload)
+    os.replace(tmp, filename)
+
+
+class _ImageStore(dict):
+    """
+    Lazy cache of Tk PhotoImages for one image palette (prefix).
+
+    Each image is opened and decoded on first access rather than all
+    up front, so startup only pays for the images actually shown. The
+    dict keeps strong references so Tk never garbage-collects a
+    PhotoImage that is still displayed.
+    """
+
+    def __init__(self, prefix):
+        super().__init__()
+        self.prefix = prefix
+
+    def __missing__(self, key):
+        with Img.open(_IMAGE_PATHS[self.prefix][key]) as im:
+            im.load()  # force the PNG decode here, not inside PhotoImage
+        image = ImageTk.PhotoImage(im)
+        self[key] = image
+        return image
+
 
 class MinesweeperApp:
     """
@@ -115,16 +181,12 @@ class MinesweeperApp:
             Open about game dialog.
         tick(self):
             Advance game time.
-        l_hold(self, event):
-            Trigger surprised face upon holding down LMB.
-        l_release(self, event):
-            Trigger up face button upon releasing LMB.
         face_button_l_hold(self, event):
             Trigger down face upon holding down LMB on face button.
         face_button_l_release(self, event):
             Reset game upon releasing LMB on face button.
         button_l_hold(self, event):
-            Trigger down tile upon holding LMB on tile button.
+            Trigger down tile and surprised face upon holding LMB.
         button_l_release(self, event):
             Click tile upon releasing LMB on tile button.
         button_r_click(self, event):
@@ -135,18 +197,26 @@ class MinesweeperApp:
             Freeze the game, disabling all buttons and stopping time.
         unfreeze(self):
             Unfreeze game, re-enabling all buttons.
-        auto_click_buttons(self, red=None, all_bombs=False):
+        auto_click_buttons(self, changed=None, red=None, all_bombs=False):
             Update all buttons whose tiles were clicked automatically.
         mark_button(self, button):
             Mark a tile, alternating between flag, question, and none.
+        set_image(button, image):
+            Set a tile button's image, skipping the Tcl call if unchanged.
         reset_game(self):
             Reset core game and GUI buttons.
         toggle_colour(self):
             Switch between colour and black-and-white images.
+        refresh_images(self):
+            Repaint all widgets from the active image palette.
         toggle_q_marks(self):
             Clear all tiles marked with "?".
+        toggle_sound(self):
+            Sync the cached sound flag with the menu checkbutton.
         load_images(self, colour):
             Load all images, creating and storing Tk PhotoImage objects.
+        preload_images(self):
+            Decode every image for both palettes ahead of first use.
         
     """
     
@@ -155,8 +225,19 @@ class MinesweeperApp:
         # Setup Minesweeper Core
         self.game = MineSweeper()
         self.images = {}
+        self._image_stores = {}
+        self._number_caches = {}
         self.widgets = {}
+        self._button_pool = []
+        self._disabled = bytearray()
+        self._grid_shape = None
+        self._question_buttons = set()
+        self._face_bbox = None
+        # '#' never matches a digit, so fresh labels always repaint.
+        self._last_bomb_chars = '###'
+        self._last_time_chars = '###'
         self.menu_vars = {}
+        self._tick_after_id = None
         self.is_frozen = False
         self.first_btn_clicked = False
         self.difficulty_levels = {
@@ -168,25 +249,39 @@ class MinesweeperApp:
         self.current_difficulty_level = None
         self.stored_settings = self.load_settings(SETTINGS_FILE)
         self.best_times = self.read_best_times(BEST_TIMES_FILE)
-        # Load Sounds
-        pygame.init()
-        self.sounds = {
-            'bomb': Sound('minesweeper/sounds/bomb.wav'),
-            'clock': Sound('minesweeper/sounds/clock.wav'),
-            'win': Sound('minesweeper/sounds/win.wav')
-        }
-        self.channels = {0: Channel(0), 1: Channel(1), 2: Channel(2)}
+        self._best_times_dirty = False
+        # Sounds are loaded lazily: holding the mixer open costs CPU
+        # even when silent, and sound is off by default.
+        self.sounds = None
+        self.channels = None
         # Initialize Tkinter Window
         self.root = Tk()
         self.root.protocol('WM_DELETE_WINDOW', self.exit)
+        # Any layout change can move the face button, so drop its
+        # cached bounding box whenever geometry changes.
+        self.root.bind('<Configure>', self._invalidate_face_bbox)
         self.root.resizable(False, False)
         self.root.iconbitmap('minesweeper/icon.ico')
         self.root.title('Minesweeper')
+        # Global bindings live here rather than in create_ui: binding
+        # again on every UI rebuild would stack a fresh Escape lambda
+        # (and its Tcl command) per colour toggle.
+        self.root.bind_all("<Key>", self.handle_key_press)
+        self.root.bind_all("<Escape>", lambda event: self.exit())
+        # Tile buttons share one class-level binding each; individual
+        # buttons just add the 'TileLabel' bindtag, which is far
+        # cheaper than three bind calls per button on big boards.
+        self.root.bind_class('TileLabel', '<ButtonPress-1>', self.button_l_hold)
+        self.root.bind_class('TileLabel', '<ButtonRelease-1>', self.button_l_release)
+        self.root.bind_class('TileLabel', '<Button-3>', self.button_r_click)
         self.create_menu()
         self.load_images(colour=self.colour_is_on())
         self.create_ui()
         # Start game with default settings
         self.start_game()
+        # Warm both palettes once the first frame is up, so the first
+        # colour toggle and the game-over faces don't pay decode cost.
+        self.root.after(100, self.preload_images)
     
     @staticmethod
     def load_settings(filename):
@@ -197,28 +292,37 @@ class MinesweeperApp:
         :return: settings
         :rtype: dict
         """
-        with open(filename, 'r') as file_in:
-            settings = json.loads(file_in.read().strip())
+        key = (filename, os.stat(filename).st_mtime_ns)
+        settings = _PARSE_CACHE.get(key)
+        if settings is None:
+            with open(filename, 'rb') as file_in:
+                data = file_in.read()
+            settings = orjson.loads(data) if orjson is not None else json.loads(data)
+            _PARSE_CACHE[key] = settings
         return settings
     
-    def save_game_settings(self, filename):
-        """
-        Write current game settings to json file.
-        
-        :param filename: file to write settings to
-        """
+    def _serialize_settings(self):
+        """Serialize current game settings to json bytes."""
         settings = {
             'level': self.current_difficulty_level,
-            'rows': len(self.game.rows),
-            'columns': len(self.game.columns),
+            'rows': self.game.n_rows,
+            'columns': self.game.n_cols,
             'bombs': self.game.num_bombs,
             'marks': self.menu_vars['marks'].get(),
             'colour': self.menu_vars['colour'].get(),
             'sound': self.menu_vars['sound'].get()
         }
-
-        with open(filename, 'w') as file_out:
-            file_out.write(json.dumps(settings) + '\n')
+        if orjson is not None:
+            return orjson.dumps(settings) + b'\n'
+        return (json.dumps(settings) + '\n').encode()
+    
+    def save_game_settings(self, filename):
+        """
+        Write current game settings to json file.
+        
+        :param filename: file to write settings to
+        """
+        _write_atomic(filename, self._serialize_settings())
     
     @staticmethod
     def read_best_times(filename):
@@ -241,14 +345,12 @@ class MinesweeperApp:
             "expert": (time, name)
         }
         """
-        best_times = {}
-        with open(filename, 'r') as file_in:
-            for line in file_in:
-                parts = line.strip().split(',')
-                level = parts[0]
-                time = int(parts[1])
-                name = parts[2]
-                best_times[level] = (time, name)
+        key = (filename, os.stat(filename).st_mtime_ns)
+        best_times = _PARSE_CACHE.get(key)
+        if best_times is None:
+            with open(filename, 'r', newline='') as file_in:
+                best_times = {level: (int(time), name) for level, time, name in csv.reader(file_in)}
+            _PARSE_CACHE[key] = best_times
         return best_times
     
     @staticmethod
@@ -264,21 +366,26 @@ class MinesweeperApp:
         intermediate,name,time
         expert,name,time
         """
-        with open(filename, 'w') as file_out:
-            for level, (time, name) in best_times.items():
-                file_out.write(f'{level},{time},{name}\n')
+        buffer = StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerows((level, time, name) for level, (time, name) in best_times.items())
+        _write_atomic(filename, buffer.getvalue().encode())
     
     def sound_is_on(self):
         """Return true if game sound is on, otherwise return false."""
-        return self.menu_vars['sound'].get() == 1
+        return self._sound_on
     
     def q_marks_are_on(self):
         """Return true if "?" marks are on, otherwise return false."""
-        return self.menu_vars['marks'].get() == 1
+        return self._marks_on
     
     def colour_is_on(self):
         """Return true if colour is on, otherwise return false."""
-        return self.menu_vars['colour'].get() == 1
+        return self._colour_on
+    
+    def toggle_sound(self):
+        """Sync the cached sound flag with the menu checkbutton."""
+        self._sound_on = self.menu_vars['sound'].get() == 1
         
     def start_game(self):
         """Initialize game with difficulty level from saved settings."""
@@ -306,19 +413,24 @@ class MinesweeperApp:
         Step 2. Pack them to the screen
         Step 3. Bind press and release events
         Step 4. Add them to self.widgets
-        Step 5. Global bindings
         """
         remove_buttons = False
         if remove:
             remove_buttons = True
             self.widgets['main_container'].pack_forget()
+            # Pooled buttons are parented to the old bottom_frame and
+            # can't survive a full UI rebuild.
+            self._button_pool.clear()
+            self.widgets['buttons'] = []
+            self._grid_shape = None
             
         main_container = LabelFrame(self.root, bd=0, bg='#c0c0c0')
         top_frame = LabelFrame(main_container, bd=6, relief=SUNKEN, bg='#c0c0c0')
         # Unmarked bombs
         unmarked_bombs = LabelFrame(top_frame, bd=3, relief=SUNKEN)
-        for x in range(3):
-            Label(unmarked_bombs, image=self.images['clock_0'], bd=0).grid(row=0, column=x)
+        bomb_labels = [Label(unmarked_bombs, image=self.images['clock_0'], bd=0) for _ in range(3)]
+        for x, label in enumerate(bomb_labels):
+            label.grid(row=0, column=x)
         # Face button
         if self.is_frozen:
             if self.game.game_is_won():
@@ -330,8 +442,9 @@ class MinesweeperApp:
         face_button = Label(top_frame, bd=0, image=face_img, bg='#c0c0c0')
         # Time
         time = LabelFrame(top_frame, bd=3, relief=SUNKEN)
-        for x in range(3):
-            Label(time, image=self.images['clock_0'], bd=0).grid(row=0, column=x)
+        time_labels = [Label(time, image=self.images['clock_0'], bd=0) for _ in range(3)]
+        for x, label in enumerate(time_labels):
+            label.grid(row=0, column=x)
         
         bottom_frame = LabelFrame(main_container, bd=6, relief=SUNKEN, bg='#c0c0c0')
         # Pack widgets to the screen.
@@ -348,7 +461,9 @@ class MinesweeperApp:
         self.widgets['main_container'] = main_container
         self.widgets['top_frame'] = top_frame
         self.widgets['unmarked_bombs'] = unmarked_bombs
+        self.widgets['bomb_labels'] = bomb_labels
         self.widgets['time'] = time
+        self.widgets['time_labels'] = time_labels
         self.widgets['face_button'] = face_button
         self.widgets['bottom_frame'] = bottom_frame
         # Create tile buttons, removing if necessary, then click buttons
@@ -356,15 +471,10 @@ class MinesweeperApp:
         # update unmarked bombs and time.
         self.create_buttons(remove=remove_buttons)
         self.auto_click_buttons(all_bombs=self.game.game_is_lost())
+        self._last_bomb_chars = '###'
+        self._last_time_chars = '###'
         self.update_unmarked_bombs()
         self.update_time()
-        # Global bindings
-        self.root.bind_all('<ButtonPress-1>', self.l_hold)
-        self.root.bind_all('<ButtonRelease-1>', self.l_release)
-        self.root.bind_all("<Key>", self.handle_key_press)
-        self.root.bind_all("<Escape>", lambda event: self.exit())
-
-        self.update_time()
     
     def create_menu(self):
         """
@@ -403,7 +513,7 @@ class MinesweeperApp:
         s.set(self.stored_settings['sound'])
         game_menu.add_checkbutton(label='Marks (?)', variable=m, command=self.toggle_q_marks)
         game_menu.add_checkbutton(label='Color', variable=cl, command=self.toggle_colour)
-        game_menu.add_checkbutton(label='Sound', variable=s)
+        game_menu.add_checkbutton(label='Sound', variable=s, command=self.toggle_sound)
         game_menu.add_separator()
         game_menu.add_command(label=f'Best Times... {"F3":>16}', command=self.show_best_times)
         game_menu.add_separator()
@@ -428,41 +538,94 @@ class MinesweeperApp:
             'colour': cl,
             'sound': s,
         }
+        # Mirror the checkbutton states as plain booleans; reading an
+        # IntVar is a Tcl round-trip, and these are checked per mouse
+        # event and per timer tick.
+        self._marks_on = m.get() == 1
+        self._colour_on = cl.get() == 1
+        self._sound_on = s.get() == 1
     
     def create_buttons(self, remove=False):
         """
-        Create tile button for each tile in core game.
-        
+        Create or reuse a tile button for each tile in core game.
+
         :param bool remove: if true, remove all buttons before creating.
+
+        Tk widget creation is expensive, so Labels are pooled: removed
+        buttons go back to the pool and new boards draw from it, only
+        creating Labels for the shortfall. A reused button just gets
+        its tile, image, and grid position reassigned. When the board
+        geometry hasn't changed at all, even the re-grid is skipped and
+        the placed buttons are reconfigured where they stand.
         """
+        shape = (self.game.n_rows, self.game.n_cols)
+        if remove and shape == self._grid_shape:
+            self._question_buttons.clear()
+            self._tile_to_button = {}
+            self._disabled[:] = bytearray(len(self._disabled))
+            for button, tile in zip(self.widgets['buttons'], self.game.tiles):
+                button.tile = tile
+                self._tile_to_button[tile] = button
+                self.set_image(button, self._mark_img[tile.mark_idx])
+            return
+
         if remove:
             for button in self.widgets['buttons']:
                 button.grid_forget()
-                
-        self.widgets['buttons'] = []
-        
+            self._button_pool.extend(self.widgets['buttons'])
+
+        buttons = self.widgets['buttons'] = []
+        self._question_buttons.clear()
+        tile_to_button = self._tile_to_button = {}
+        # Disabled flags live in one flat bytearray indexed by board
+        # position, not as per-Label attribute dict entries.
+        self._disabled = bytearray(len(self.game.tiles))
+
         button_container = self.widgets['bottom_frame']
-        column = 0
-        row = 0
-        
-        for tile in self.game.tiles.values():
-            
-            button = Label(button_container, bd=0, image=self.images[f'tile_{tile.mark}'])
-            self.widgets['buttons'].append(button)
-            
+        ncols = self.game.n_cols
+        # Hoist everything invariant out of the ~480-iteration loop:
+        # method and dict lookups become plain local loads.
+        pool = self._button_pool
+        pool_pop = pool.pop
+        append = buttons.append
+        mark_img = self._mark_img
+        set_image = self.set_image
+
+        for i, tile in enumerate(self.game.tiles):
+
+            if pool:
+                button = pool_pop()
+            else:
+                button = Label(button_container, bd=0)
+                button.bindtags(('TileLabel',) + button.bindtags())
+                button.current_image = None
+            append(button)
+
             button.tile = tile
-            button.is_disabled = False
-            
-            button.bind('<ButtonPress-1>', self.button_l_hold)
-            button.bind('<ButtonRelease-1>', self.button_l_release)
-            button.bind('<Button-3>', self.button_r_click)
-            
+            button.index = i
+            tile_to_button[tile] = button
+            set_image(button, mark_img[tile.mark_idx])
+
+            row, column = divmod(i, ncols)
             button.grid(row=row, column=column)
-            
-            column += 1
-            if column % len(self.game.columns) == 0:
-                column = 0
-                row += 1
+
+        self._grid_shape = shape
+    
+    @staticmethod
+    def set_image(button, image):
+        """
+        Set a tile button's image, skipping the Tcl call if unchanged.
+
+        :param button: tile button to configure
+        :param image: PhotoImage the button should show
+
+        Cascades and repaints often reassign the image a button is
+        already showing; comparing against the remembered reference
+        avoids the full configure round-trip in that case.
+        """
+        if button.current_image is not image:
+            button.configure(image=image)
+            button.current_image = image
     
     def handle_key_press(self, event):
         """Handle key presses."""
@@ -488,24 +651,29 @@ class MinesweeperApp:
         "0" -> clock_0.png
         "3" -> clock_3.png
         E.G. num=-1 -> "0-1" -> [clock_0, clock_-, clock_1]
+
+        The whole domain of the counters (-99..999) is precomputed at
+        image-load time, so this is a single dict lookup.
         """
-        return [self.images[f'clock_{char}'] for char in f'{num:03}']
+        return self._number_image_cache[num]
+    
+    def _update_digits(self, labels, num, last_chars):
+        """Reconfigure only the digit labels whose character changed."""
+        chars = f'{num:03}'
+        for label, char, old in zip(labels, chars, last_chars):
+            if char != old:
+                label.configure(image=self._clock_img[char])
+        return chars
     
     def update_unmarked_bombs(self):
         """Update unmarked bombs counter with number from core game."""
-        unmarked_bombs = self.widgets['unmarked_bombs']
-        image_labels = list(unmarked_bombs.children.values())
-        image_list = self.assemble_number_images(self.game.unmarked_bombs)
-        for x in range(3):
-            image_labels[x].configure(image=image_list[x])
+        labels = self.widgets['bomb_labels']
+        self._last_bomb_chars = self._update_digits(labels, self.game.unmarked_bombs, self._last_bomb_chars)
     
     def update_time(self):
         """Update time counter with number from core game."""
-        time = self.widgets['time']
-        image_labels = list(time.children.values())
-        image_list = self.assemble_number_images(self.game.time)
-        for x in range(3):
-            image_labels[x].configure(image=image_list[x])
+        labels = self.widgets['time_labels']
+        self._last_time_chars = self._update_digits(labels, self.game.time, self._last_time_chars)
     
     def change_difficulty(self, difficulty):
         """
@@ -567,11 +735,30 @@ class MinesweeperApp:
         will_reset = dialogs.ask_should_reset(self.root, self.best_times)
         if will_reset:
             self.best_times = {'beginner': (999, 'Anonymous'), 'intermediate': (999, 'Anonymous'), 'expert': (999, 'Anonymous')}
+            self._best_times_dirty = True
     
     def exit(self):
-        """Write best times to file and quit game."""
-        self.write_best_times(BEST_TIMES_FILE, self.best_times)
-        self.save_game_settings(SETTINGS_FILE)
+        """
+        Write best times and settings to file and quit game.
+
+        Serialization happens here on the main thread (it reads Tk
+        variables); the disk writes run in a background thread so the
+        window closes without waiting on I/O. The thread is non-daemon,
+        so the interpreter still waits for the flush to finish, and the
+        atomic renames mean a half-written file can never be observed.
+        """
+        files = [(SETTINGS_FILE, self._serialize_settings())]
+        if self._best_times_dirty:
+            buffer = StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+            writer.writerows((level, time, name) for level, (time, name) in self.best_times.items())
+            files.append((BEST_TIMES_FILE, buffer.getvalue().encode()))
+
+        def flush():
+            for filename, payload in files:
+                _write_atomic(filename, payload)
+
+        Thread(target=flush).start()
         self.root.quit()
     
     @staticmethod
@@ -583,37 +770,52 @@ class MinesweeperApp:
         """Open about game dialog."""
         dialogs.show_about_game(self.root)
     
+    def _ensure_mixer(self):
+        """Initialize the pygame mixer and load sounds on first use."""
+        if self.sounds is not None:
+            return
+        # A bigger buffer trades ~26ms of latency (imperceptible for
+        # these effects) for fewer audio callbacks and no underruns
+        # when other apps share the device.
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=4096)
+        pygame.init()
+        self.sounds = {
+            'bomb': Sound('minesweeper/sounds/bomb.wav'),
+            'clock': Sound('minesweeper/sounds/clock.wav'),
+            'win': Sound('minesweeper/sounds/win.wav')
+        }
+        self.channels = {0: Channel(0), 1: Channel(1), 2: Channel(2)}
+    
+    def _cancel_tick(self):
+        """Cancel the pending tick callback, if any."""
+        if self._tick_after_id is not None:
+            self.root.after_cancel(self._tick_after_id)
+            self._tick_after_id = None
+    
     def tick(self):
-        """Advance game time."""
-        time = self.widgets['time']
-        if self.first_btn_clicked:
-            if self.sound_is_on():
-                self.channels[0].play(self.sounds['clock'])
-            self.game.tick()
-            self.update_time()
-            time.after(1000, self.tick)
-        
-    def l_hold(self, event):
-        """Trigger surprised face upon holding down LMB."""
-        face_button = self.widgets['face_button']
-        x = face_button.winfo_rootx()
-        y = face_button.winfo_rooty()
-        if not (x < event.x_root < x + 52) or not (y < event.y_root < y + 52):
-            if not self.is_frozen:
-                face_button.configure(image=self.images['face_danger'])
-    
-    def l_release(self, event):
-        """Trigger up face button upon releasing LMB."""
-        assert event
-        face_button = self.widgets['face_button']
-        if not self.is_frozen:
-            face_button.configure(image=self.images['face_up'])
+        """Refresh the time display from the game clock."""
+        # Only tick audibly when the window actually has focus;
+        # ticking from a background window just churns the mixer.
+        if self.sound_is_on() and self.root.focus_displayof():
+            self._ensure_mixer()
+            # Don't restart the tick sound if the last one is still
+            # playing; each play re-primes an SDL mixer buffer.
+            channel = self.channels[0]
+            if not channel.get_busy():
+                channel.play(self.sounds['clock'])
+        self.update_time()
+        # Game-over and resets cancel this handle rather than letting
+        # the callback fire once a second just to test a flag.
+        self._tick_after_id = self.root.after(1000, self.tick)
         
     def face_button_l_hold(self, event):
         """Trigger down face upon holding down LMB on face button."""
         face_button = event.widget
         face_button.configure(image=self.images['face_down'])
     
+    def _invalidate_face_bbox(self, event=None):
+        self._face_bbox = None
+
     def face_button_l_release(self, event):
         """Reset game upon releasing LMB on face button."""
         face_button = event.widget
@@ -624,20 +826,26 @@ class MinesweeperApp:
                 face_button.configure(image=self.images['face_loss'])
         else:
             face_button.configure(image=self.images['face_up'])
-        x = face_button.winfo_rootx()
-        y = face_button.winfo_rooty()
-        if (x < event.x_root < x + 52) and (y < event.y_root < y + 52):
+        if self._face_bbox is None:
+            x = face_button.winfo_rootx()
+            y = face_button.winfo_rooty()
+            self._face_bbox = (x, y, x + 52, y + 52)
+        x1, y1, x2, y2 = self._face_bbox
+        if (x1 < event.x_root < x2) and (y1 < event.y_root < y2):
             self.reset_game()
     
     def button_l_hold(self, event):
-        """Trigger down tile upon holding LMB on tile button."""
+        """Trigger down tile and surprised face upon holding LMB."""
         button = event.widget
-        if not self.is_frozen and not button.is_disabled:
-            if button.tile.mark == 'question':
+        if self.is_frozen:
+            return
+        self.widgets['face_button'].configure(image=self.images['face_danger'])
+        if not self._disabled[button.index]:
+            if button.tile.mark_idx == MARK_QUESTION:
                 image = self.images['tile_question_down']
             else:
                 image = self.images['tile_down']
-            button.configure(image=image)
+            self.set_image(button, image)
     
     def button_l_release(self, event):
         """
@@ -647,19 +855,22 @@ class MinesweeperApp:
         tile. This ensures that the first tile clicked will never be a bomb.
         Clicking the first tile also starts the game timer.
         """
-        time = self.widgets['time']
         button = event.widget
         tile = button.tile
-        if not self.is_frozen and not button.is_disabled:
+        if not self.is_frozen and not self._disabled[button.index]:
             if 0 < event.x <= 32 and 0 < event.y <= 32:
-                if tile.mark != 'flag':
+                if tile.mark_idx != MARK_FLAG:
                     if not self.first_btn_clicked:
                         self.game.scatter_bombs(tile_to_avoid=tile)
+                        self.game.start_timer()
                         self.first_btn_clicked = True
-                        time.after(0, self.tick)
+                        self._tick_after_id = self.root.after(0, self.tick)
                     self.click_button(button)
             else:
-                button.configure(image=self.images[f'tile_{tile.mark}'])
+                self.set_image(button, self._mark_img[tile.mark_idx])
+        # Put the face back up unless the click just ended the game.
+        if not self.is_frozen:
+            self.widgets['face_button'].configure(image=self.images['face_up'])
     
     def button_r_click(self, event):
         """Mark tile upon clicking RMB on tile button."""
@@ -679,11 +890,12 @@ class MinesweeperApp:
         """
         face_button = self.widgets['face_button']
         tile = button.tile
-        multiple = self.game.click_tile(tile)
-        button.is_disabled = True
+        changed = self.game.click_tile(tile)
+        self._disabled[button.index] = True
         
         if self.game.game_is_won():  # Win
             if self.sound_is_on():
+                self._ensure_mixer()
                 self.channels[1].play(self.sounds['win'])
             face_button.configure(image=self.images['face_win'])
             self.freeze()
@@ -691,84 +903,148 @@ class MinesweeperApp:
             if self.game.time < self.best_times[self.current_difficulty_level][0]:
                 name = dialogs.ask_fastest_name(self.root, self.current_difficulty_level)
                 self.best_times[self.current_difficulty_level] = (self.game.time, name)
+                self._best_times_dirty = True
         elif not tile.is_safe:  # Loss
             if self.sound_is_on():
+                self._ensure_mixer()
                 self.channels[2].play(self.sounds['bomb'])
             self.game.click_all_bombs()
             self.auto_click_buttons(red=button, all_bombs=True)
             face_button.configure(image=self.images['face_loss'])
             self.freeze()
-        elif multiple:  # multiple buttons were automatically clicked
-            self.auto_click_buttons()
+        elif len(changed) > 1:  # a cascade revealed several tiles
+            self.auto_click_buttons(changed)
         else:  # Single button
-            image = self.images[f'tile_{tile.number}']
-            button.configure(image=image)
+            self.set_image(button, self._num_img[tile.number])
     
     def freeze(self):
         """Freeze the game, disabling all buttons and stopping time."""
         self.is_frozen = True
         self.first_btn_clicked = False
+        self._cancel_tick()
+        self.game.stop_timer()
     
     def unfreeze(self):
         """Unfreeze game, re-enabling all buttons."""
         self.is_frozen = False
+        self._cancel_tick()
     
-    def auto_click_buttons(self, red=None, all_bombs=False):
+    def auto_click_buttons(self, changed=None, red=None, all_bombs=False):
         """
         Update all buttons whose tiles were clicked automatically.
         
+        :param list changed: tiles that changed, else scan the board
         :param Tile red: bomb tile to mark red if game is over else None
         :param bool all_bombs: if True, reveal all bomb tiles (game end)
         
         In the original Minesweeper, when a bomb is clicked, it turns red and
         all other bombs are revealed. All incorrectly flagged bombs are marked
         with a cross.
+
+        Cascades pass the change-list from the core engine, so only the
+        revealed tiles' buttons are touched. Game-end reveals still scan
+        the whole board: wrongly flagged tiles get crosses without ever
+        being "changed".
         """
-        for button in self.widgets['buttons']:
+        if changed is not None and not all_bombs:
+            buttons = [self._tile_to_button[tile] for tile in changed]
+        else:
+            buttons = self.widgets['buttons']
+        # Work out every new image first, then push them to Tk in one
+        # tight pass and let a single idletasks cycle repaint the board.
+        # All invariant lookups are bound to locals up front; the sweep
+        # touches every button on game-end reveals.
+        disabled = self._disabled
+        num_img = self._num_img
+        tile_x = self.images['tile_x']
+        tile_red = self.images['tile_red']
+        tile_bomb = self.images['tile_bomb']
+        updates = []
+        append = updates.append
+        for button in buttons:
             tile = button.tile
-            if tile.is_clicked or (not tile.is_safe and all_bombs) or (tile.mark == 'flag' and all_bombs):
+            if tile.is_clicked or (not tile.is_safe and all_bombs) or (tile.mark_idx == MARK_FLAG and all_bombs):
                 if tile.is_safe:
-                    if all_bombs and tile.mark == 'flag':
-                        image = self.images['tile_x']
+                    if all_bombs and tile.mark_idx == MARK_FLAG:
+                        image = tile_x
                     else:
-                        image = self.images[f'tile_{tile.number}']
+                        image = num_img[tile.number]
                 elif button == red:
-                    image = self.images['tile_red']
+                    image = tile_red
                 else:
-                    image = self.images['tile_bomb']
-                button.configure(image=image)
-                button.is_disabled = True
+                    image = tile_bomb
+                append((button, image))
+                disabled[button.index] = True
+        set_image = self.set_image
+        for button, image in updates:
+            set_image(button, image)
+        self.root.update_idletasks()
     
     def mark_button(self, button):
         """Mark a tile, alternating between flag, question, and none."""
         tile = button.tile
         self.game.mark_tile(tile)
         # If "?" marks are off, skip "?" by marking tile again.
-        if tile.mark == 'question' and not self.q_marks_are_on():
+        if tile.mark_idx == MARK_QUESTION and not self.q_marks_are_on():
             self.game.mark_tile(tile)
         self.update_unmarked_bombs()
-        button.configure(image=self.images[f'tile_{tile.mark}'])
-        button.is_disabled = tile.mark == 'flag'
+        self.set_image(button, self._mark_img[tile.mark_idx])
+        self._disabled[button.index] = tile.mark_idx == MARK_FLAG
+        # Track "?" buttons so toggle_q_marks needn't scan the board.
+        if tile.mark_idx == MARK_QUESTION:
+            self._question_buttons.add(button)
+        else:
+            self._question_buttons.discard(button)
     
     def reset_game(self):
         """Reset core game and GUI buttons."""
         self.first_btn_clicked = False
         self.unfreeze()
         self.game.reset()
+        self._question_buttons.clear()
         self.update_unmarked_bombs()
         self.update_time()
+        tile_up = self.images['tile_up']
+        self._disabled[:] = bytearray(len(self._disabled))
         for button in self.widgets['buttons']:
-            button.is_disabled = False
-            button.configure(image=self.images['tile_up'])
+            self.set_image(button, tile_up)
     
     def toggle_colour(self):
         """
         Switch between colour and black-and-white images.
-        
-        This requires a re-load of the entire UI.
+
+        Both palettes are kept cached, so toggling just swaps the active
+        image store and repaints the existing widgets in place.
         """
+        self._colour_on = self.menu_vars['colour'].get() == 1
         self.load_images(colour=self.colour_is_on())
-        self.create_ui(remove=True)
+        self.refresh_images()
+
+    def refresh_images(self):
+        """Repaint all widgets from the active image palette."""
+        for button in self.widgets['buttons']:
+            tile = button.tile
+            if tile.is_clicked and tile.is_safe:
+                image = self._num_img[tile.number]
+            else:
+                image = self._mark_img[tile.mark_idx]
+            self.set_image(button, image)
+        # Redo bomb/cross reveals if the game has been lost.
+        self.auto_click_buttons(all_bombs=self.game.game_is_lost())
+        if self.is_frozen:
+            if self.game.game_is_won():
+                face_img = self.images['face_win']
+            else:
+                face_img = self.images['face_loss']
+        else:
+            face_img = self.images['face_up']
+        self.widgets['face_button'].configure(image=face_img)
+        # The digit characters haven't changed but the palette has, so
+        # force a full repaint of both counters.
+        self._last_bomb_chars = '###'
+        self._last_time_chars = '###'
+        self.update_unmarked_bombs()
+        self.update_time()
     
     def toggle_q_marks(self):
         """
@@ -777,24 +1053,67 @@ class MinesweeperApp:
         When ? marks are turned off, unlike in the original Minesweeper, the
         currently marked "?" tiles are reset instead of left.
         """
-        for button in self.widgets['buttons']:
-            if button.tile.mark == 'question':
-                self.mark_button(button)
+        self._marks_on = self.menu_vars['marks'].get() == 1
+        # mark_button mutates the set, so iterate over a snapshot.
+        for button in list(self._question_buttons):
+            self.mark_button(button)
+    
+    def preload_images(self):
+        """
+        Decode every image for both palettes ahead of first use.
+
+        PIL releases the GIL while inflating PNGs, so the file decodes
+        run in a thread pool; the PhotoImage wrapping stays on the main
+        thread because Tk is not thread-safe. Images a store has
+        already loaded lazily are left alone.
+        """
+        jobs = []
+        for prefix in ('nm', 'bw'):
+            store = self._image_stores.get(prefix)
+            if store is None:
+                store = self._image_stores[prefix] = _ImageStore(prefix)
+            jobs.extend((store, key) for key in _IMAGE_KEYS if key not in store)
+
+        def decode(job):
+            store, key = job
+            with Img.open(_IMAGE_PATHS[store.prefix][key]) as im:
+                # copy() forces the decode here, off the main thread
+                return im.copy()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            decoded = list(executor.map(decode, jobs))
+        for (store, key), im in zip(jobs, decoded):
+            store[key] = ImageTk.PhotoImage(im)
     
     def load_images(self, colour):
         """
-        Load all images, creating and storing Tk PhotoImage objects.
-        
-        :param colour: if true, load colour images, else load b & w.
-        
+        Select the image palette, loading images lazily on first use.
+
+        :param colour: if true, use colour images, else use b & w.
+
         All images must have a global storage method, e.g. self.images, so that
         Tkinter can constantly reference them, otherwise they won't be
         displayed.
         """
         prefix = 'nm' if colour else 'bw'
-        keys = ['face_up', 'face_down', 'face_danger', 'face_win', 'face_loss', 'tile_up', 'tile_down', 'tile_bomb', 'tile_red', 'tile_x', 'tile_none', 'tile_flag', 'tile_question', 'tile_question_down', 'tile_0', 'tile_1', 'tile_2', 'tile_3', 'tile_4', 'tile_5', 'tile_6', 'tile_7', 'tile_8', 'clock_-', 'clock_0', 'clock_1', 'clock_2', 'clock_3', 'clock_4', 'clock_5', 'clock_6', 'clock_7', 'clock_8', 'clock_9']
-        for key in keys:
-            self.images[key] = ImageTk.PhotoImage(Img.open(f'minesweeper/images/{prefix}_{key}.png'))
+        store = self._image_stores.get(prefix)
+        if store is None:
+            store = self._image_stores[prefix] = _ImageStore(prefix)
+        self.images = store
+        # Direct references for the per-click hot paths; indexing these
+        # avoids an f-string format plus dict hash per button update.
+        self._num_img = tuple(store[f'tile_{n}'] for n in range(9))
+        self._mark_img = tuple(store[f'tile_{mark}'] for mark in MARKS)
+        self._clock_img = {char: store[f'clock_{char}'] for char in '0123456789-'}
+        # The counters only ever show -99..999, so precompute the whole
+        # digit-image table once per palette and keep it across toggles.
+        cache = self._number_caches.get(prefix)
+        if cache is None:
+            clock = self._clock_img
+            cache = self._number_caches[prefix] = {
+                n: [clock[char] for char in f'{n:03}'] for n in range(-99, 1000)
+            }
+        self._number_image_cache = cache
 
 
 if __name__ == '__main__':
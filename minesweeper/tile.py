@@ -1,17 +1,21 @@
-from collections import deque
+MARKS = ('none', 'flag', 'question')
+# Integer mark constants: comparing these is a single int compare,
+# where comparing the names costs a full string comparison.
+MARK_NONE, MARK_FLAG, MARK_QUESTION = range(3)
 
 
 class Tile:
     """A tile in a game of minesweeper."""
-    
-    def __init__(self, row, column, neighbours, is_safe=True, number=0):
+
+    __slots__ = ('row', 'column', 'adj', 'is_clicked', 'is_safe', 'mark_idx', 'number')
+
+    def __init__(self, row, column, is_safe=True, number=0):
         self.row = row
         self.column = column
-        self.neighbours = neighbours
+        self.adj = ()
         self.is_clicked = False
         self.is_safe = is_safe
-        self.marks = deque(('none', 'flag', 'question'))
-        self.mark = self.marks[0]
+        self.mark_idx = MARK_NONE
         self.number = number
     
     def __str__(self):
@@ -20,10 +24,13 @@ class Tile:
     def __repr__(self):
         return 'safe' if self.is_safe else 'bomb'
     
+    @property
+    def mark(self):
+        """Name of the tile's current mark: none, flag or question."""
+        return MARKS[self.mark_idx]
+    
     def change_mark(self):
-        self.marks.rotate(-1)
-        self.mark = self.marks[0]
+        self.mark_idx = (self.mark_idx + 1) % 3
     
     def reset_mark(self):
-        self.marks = deque(('none', 'flag', 'question'))
-        self.mark = self.marks[0]
+        self.mark_idx = MARK_NONE